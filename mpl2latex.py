@@ -1,6 +1,47 @@
-import matplotlib
-import matplotlib.pyplot as plt
-from copy import deepcopy
+import subprocess
+from functools import lru_cache
+from numbers import Number
+
+_INCHES_PER_PT = 1.0/72.27           # Convert pt to inch
+_GOLDEN = (5.0**0.5 - 1.0)/2.0       # Golden ratio
+
+# rcParams that are the same for every LaTeX context
+_PGF_RC_BASE = {
+    "pgf.texsystem": "pdflatex",
+    'font.family': 'serif',
+    'text.usetex': True,
+    'pgf.rcfonts': False,
+}
+
+@lru_cache(maxsize=1)
+def _lazy():
+    """ Import matplotlib only when it is first needed, returning the cached modules
+    """
+    import matplotlib
+    import matplotlib.pyplot as plt
+    return matplotlib, plt
+
+@lru_cache(maxsize=1)
+def _ensure_latex():
+    """ Check once per process that LaTeX is available, raising if it is not
+    """
+    subprocess.check_call(["latex", "-help"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+@lru_cache(maxsize=16)
+def _build_rc(preamble, SMALL_SIZE, MEDIUM_SIZE, BIGGER_SIZE, BIGGEST_SIZE):
+    """ Build the LaTeX rcParams for a given *preamble* and font sizes, cached since they do not change
+    """
+    return {
+        **_PGF_RC_BASE,
+        "pgf.preamble": preamble,
+        'font.size': SMALL_SIZE,               # controls default text sizes
+        'axes.titlesize': BIGGER_SIZE,         # fontsize of the axes title
+        'axes.labelsize': MEDIUM_SIZE,         # fontsize of the x and y labels
+        'xtick.labelsize': SMALL_SIZE,         # fontsize of the tick labels
+        'ytick.labelsize': SMALL_SIZE,         # fontsize of the tick labels
+        'legend.fontsize': MEDIUM_SIZE,        # legend fontsize
+        'figure.titlesize': BIGGEST_SIZE,      # fontsize of the figure title
+    }
 
 class mpl2latex():
     """ Plot matplotlib figure in pgf for perfect LaTeX reports
@@ -26,8 +67,6 @@ class mpl2latex():
             only "\\usepackage[utf8]{inputenc}" is used.
         original_backend: string
             Original backend when the class is initialized
-        original_rcParams: matplotlib.RcParams
-            Original rcParams when the class is initialized
         backend : string, optional
             Matplotlib backend to use. Default is pgf
 
@@ -46,8 +85,6 @@ class mpl2latex():
                 only "\\usepackage[utf8]{inputenc}" is used.
             original_backend: string
                 Original backend when the class is initialized
-            original_rcParams: matplotlib.RcParams
-                Original rcParams when the class is initialized
             backend : string, optional
                 Matplotlib backend to use. Default is pgf
                 
@@ -73,59 +110,57 @@ class mpl2latex():
     """
     
     def __init__(self, back_flag, packages = None, backend='pgf', SMALL_SIZE = 8, MEDIUM_SIZE = 10, BIGGER_SIZE = 11, BIGGEST_SIZE = 12):
-        import subprocess; subprocess.check_call(["latex", "-help"])
+        _ensure_latex()
         
+        self._mpl, self._plt = _lazy()
         self.back_flag = back_flag
-        self.original_backend = matplotlib.pyplot.get_backend()
-        self.original_rcParams = deepcopy(matplotlib.rcParams) # Necessary to create a copy, not a reference
+        self.original_backend = self._plt.get_backend()
         self.backend = backend
         self.SMALL_SIZE = SMALL_SIZE
         self.MEDIUM_SIZE = MEDIUM_SIZE
         self.BIGGER_SIZE = BIGGER_SIZE
         self.BIGGEST_SIZE = BIGGEST_SIZE
 
-        if packages == None:
+        if packages is None:
             packages = [ "\\usepackage[utf8]{inputenc}" ]
         self.packages = packages
+        self._preamble = "\n".join( self.packages )
+        # rcParams set on entry, and the current values of the same keys restored on exit
+        self._rc_set = _build_rc( self._preamble, SMALL_SIZE, MEDIUM_SIZE, BIGGER_SIZE, BIGGEST_SIZE ) if back_flag else {}
+        self._rc_restore = { k: self._mpl.rcParams[k] for k in self._rc_set }
         
 
     def __enter__(self):
         """ If *self.back_flag* is True set all the rc parameters and the correct backend. If False only sets the fontsizes.
         """
         if self.back_flag:
-            # Set LaTeX params
-            matplotlib.rcParams.update({ 
-                "pgf.texsystem": "pdflatex",
-                'font.family': 'serif',
-                'text.usetex': True,
-                'pgf.rcfonts': False,
-                "pgf.preamble": "\n".join( self.packages ),
-            })
-            plt.rc('font', size=self.SMALL_SIZE)          # controls default text sizes
-            plt.rc('axes', titlesize=self.BIGGER_SIZE)     # fontsize of the axes title
-            plt.rc('axes', labelsize=self.MEDIUM_SIZE)    # fontsize of the x and y labels
-            plt.rc('xtick', labelsize=self.SMALL_SIZE)    # fontsize of the tick labels
-            plt.rc('ytick', labelsize=self.SMALL_SIZE)    # fontsize of the tick labels
-            plt.rc('legend', fontsize=self.MEDIUM_SIZE)    # legend fontsize
-            plt.rc('figure', titlesize=self.BIGGEST_SIZE)  # fontsize of the figure title
+            # Set LaTeX params and fontsizes
+            self._mpl.rcParams.update( self._rc_set )
 
 
     def __exit__(self, etype, value, traceback):
         """ When exiting the context return to usual parameters, i.e. to original backend and original rcparams
         """
-        # --- reset rcParams ---
-        matplotlib.rcParams.update( self.original_rcParams )
-        matplotlib.rcParams.update({ 'text.usetex' : False }) #Manually disable latex
+        # --- reset the rcParams modified in __enter__ ---
+        self._mpl.rcParams.update( self._rc_restore )
+        self._mpl.rcParams.update({ 'text.usetex' : False }) #Manually disable latex
+
+@lru_cache(maxsize=32)
+def _latex_figsize(wf, hf, columnwidth):
+    """ Cached figure size for scalar *wf* and *hf*, see :func:`latex_figsize`
+    """
+    fig_width = columnwidth*wf*_INCHES_PER_PT  # width in inches
+    return (fig_width, fig_width*hf)
 
-def latex_figsize(wf=0.5, hf=(5.**0.5-1.0)/2.0, columnwidth=510):
+def latex_figsize(wf=0.5, hf=_GOLDEN, columnwidth=510):
     """
         Get the correct figure size to be displayed in a latex report/publication
     
     Parameters
     ----------
-    wf : float, optional
+    wf : float or array_like, optional
         width fraction in columnwidth units. Default to 0.5
-    hf : float, optional
+    hf : float or array_like, optional
         height fraction in columnwidth units. Set by default to golden ratio.
     columnwidth: float 
         width of the column in latex. Get this from LaTeX using \showthe\columnwidth
@@ -133,12 +168,13 @@ def latex_figsize(wf=0.5, hf=(5.**0.5-1.0)/2.0, columnwidth=510):
         
     Returns
     -------
-    fig_size: list of float
-        fig_size [width, height] that should be given to matplotlib
+    fig_size: tuple of float or numpy.ndarray
+        fig_size (width, height) that should be given to matplotlib. If *wf* or *hf*
+        are arrays, an array of shape (..., 2) with the broadcasted sizes
     """
-    
-    fig_width_pt = columnwidth*wf 
-    inches_per_pt = 1.0/72.27               # Convert pt to inch
-    fig_width = fig_width_pt*inches_per_pt  # width in inches
-    fig_height = fig_width*hf      # height in inches
-    return [fig_width, fig_height]
+    if isinstance(wf, Number) and isinstance(hf, Number):
+        return _latex_figsize(wf, hf, columnwidth)
+
+    import numpy as np
+    fig_width = columnwidth*np.asarray(wf)*_INCHES_PER_PT  # width in inches
+    return np.stack( np.broadcast_arrays(fig_width, fig_width*np.asarray(hf)), axis=-1 )